@@ -1,4 +1,18 @@
-from .bq_runner import BigQueryRunner
-from .model_gateway import get_llm
+from typing import TYPE_CHECKING, Any
 
 __all__ = ["BigQueryRunner", "get_llm"]
+
+if TYPE_CHECKING:
+    from .bq_runner import BigQueryRunner
+    from .model_gateway import get_llm
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy re-exports: importing one backend must not pull in the other's SDK
+    if name == "BigQueryRunner":
+        from .bq_runner import BigQueryRunner
+        return BigQueryRunner
+    if name == "get_llm":
+        from .model_gateway import get_llm
+        return get_llm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
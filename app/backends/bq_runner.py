@@ -1,11 +1,18 @@
 # app/backends/bq_runner.py
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple
 
-import pandas as pd
 from google.cloud import bigquery
 
+if TYPE_CHECKING:  # pandas loads only when to_dataframe() materializes results
+    import pandas as pd
+
+try:  # Arrow-based Storage Read API (google-cloud-bigquery[bqstorage])
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
+
 _log = logging.getLogger(__name__)
 
 
@@ -13,9 +20,9 @@ class BigQueryRunner:
     """
     Lightweight BigQuery executor.
 
-    - Initializes a BigQuery client
-    - Executes SQL and returns pandas DataFrames
-    - Fetches table schema metadata
+    - Initializes a BigQuery client (plus a reusable Storage Read client when available)
+    - Executes SQL and returns pandas DataFrames (Arrow download path when possible)
+    - Fetches table schema metadata (cached per session)
     """
 
     def __init__(
@@ -37,7 +44,18 @@ class BigQueryRunner:
             _log.error("BigQuery client initialization failed: %s", exc)
             raise
 
-    def execute_query(self, sql_query: str, job_config: bigquery.QueryJobConfig) -> pd.DataFrame:
+        # (dataset_id, table_name) -> column metadata; schemas are stable within a session
+        self._schema_cache: Dict[Tuple[Optional[str], str], List[Dict[str, Any]]] = {}
+
+        self.bqstorage_client = None
+        if bigquery_storage is not None:
+            try:
+                self.bqstorage_client = bigquery_storage.BigQueryReadClient()
+                _log.info("BigQuery Storage Read client ready.")
+            except Exception as exc:
+                _log.warning("Storage Read client unavailable (%s); using REST downloads.", exc)
+
+    def execute_query(self, sql_query: str, job_config: bigquery.QueryJobConfig) -> "pd.DataFrame":
         """
         Run a SQL statement and return results as a DataFrame.
 
@@ -51,7 +69,12 @@ class BigQueryRunner:
         try:
             _log.info("Submitting query to BigQuery.")
             job = self.client.query(sql_query, job_config=job_config)
-            frame = job.result().to_dataframe()
+            rows = job.result()
+            if self.bqstorage_client is not None:
+                # Arrow record batches via the shared Storage Read client
+                frame = rows.to_dataframe(bqstorage_client=self.bqstorage_client)
+            else:
+                frame = rows.to_dataframe(create_bqstorage_client=False)
             _log.info("Query finished. Rows returned: %d", len(frame))
             return frame
         except Exception as exc:
@@ -61,6 +84,7 @@ class BigQueryRunner:
     def get_table_schema(self, table_name: str) -> List[Dict[str, Any]]:
         """
         Retrieve column metadata for a table within the configured dataset.
+        Results are cached on the runner; treat the returned list as read-only.
 
         Args:
             table_name: Table identifier (e.g., 'orders') within dataset_id.
@@ -68,20 +92,26 @@ class BigQueryRunner:
         Returns:
             List of dicts with keys: name, type, mode, description.
         """
+        cache_key = (self.dataset_id, table_name)
+        cached = self._schema_cache.get(cache_key)
+        if cached is not None:
+            _log.debug("Schema cache hit for table: %s", table_name)
+            return cached
+
         try:
             table_ref = f"{self.dataset_id}.{table_name}"
             table = self.client.get_table(table_ref)
-            cols: List[Dict[str, Any]] = []
-            for field in table.schema:
-                cols.append(
-                    {
-                        "name": field.name,
-                        "type": field.field_type,
-                        "mode": field.mode,
-                        "description": field.description or "",
-                    }
-                )
+            cols: List[Dict[str, Any]] = [
+                {
+                    "name": field.name,
+                    "type": field.field_type,
+                    "mode": field.mode,
+                    "description": field.description or "",
+                }
+                for field in table.schema
+            ]
             _log.info("Schema fetched for table: %s", table_name)
+            self._schema_cache[cache_key] = cols
             return cols
         except Exception as exc:
             _log.error("Failed to fetch schema for %s: %s", table_name, exc)
@@ -1,20 +1,18 @@
 # app/backends/model_gateway.py
 
 import logging
+import functools
 from typing import Optional
 
 from langchain_core.runnables import Runnable
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.boot.load_settings import AppConfigLoader
-from app.boot.env_vars import EnvConfig
+from app.boot.env_vars import get_env
 
 _log = logging.getLogger(__name__)
 
 
-_SHARED_LLM: Optional[Runnable] = None
-
-
 def _bootstrap_llm() -> Runnable:
     """
     Build the primary Gemini chat model with a fallback.
@@ -22,12 +20,12 @@ def _bootstrap_llm() -> Runnable:
     """
     _log.info("Creating Gemini client(s) with fallback configuration.")
     try:
-        api_key: Optional[str] = EnvConfig().google_api_key
+        api_key: Optional[str] = get_env().google_api_key
         if not api_key:
             _log.error("Missing GOOGLE_API_KEY in environment.")
             raise ValueError("GOOGLE_API_KEY is required to initialize the LLM backend.")
 
-        cfg = AppConfigLoader().get_config()
+        cfg = AppConfigLoader().get_config_readonly()
         agent_cfg = cfg.get("agent", {})
 
         
@@ -54,13 +52,11 @@ def _bootstrap_llm() -> Runnable:
         raise
 
 
+@functools.lru_cache(maxsize=1)
 def get_llm() -> Runnable:
     """
     Provide a process-wide shared LLM instance.
     Lazily initializes on first call, then reuses the same client.
     """
-    global _SHARED_LLM
-    if _SHARED_LLM is None:
-        _log.info("Initializing shared LLM instance.")
-        _SHARED_LLM = _bootstrap_llm()
-    return _SHARED_LLM
+    _log.info("Initializing shared LLM instance.")
+    return _bootstrap_llm()
@@ -1,4 +1,4 @@
 from .load_settings import AppConfigLoader
-from .env_vars import EnvConfig
+from .env_vars import EnvConfig, get_env
 
-__all__ = ["AppConfigLoader", "EnvConfig"]
+__all__ = ["AppConfigLoader", "EnvConfig", "get_env"]
@@ -3,23 +3,36 @@
 import os
 import sys
 import logging
+import functools
+from dataclasses import dataclass
 from typing import Optional
 
 _log = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
 class EnvConfig:
     """
-    Environment variable accessor.
+    Snapshot of the environment variables the app depends on.
 
-    - Ensures GOOGLE_API_KEY is present at process start.
-    - Exposes `google_api_key` for consumers.
+    - `google_api_key`: Gemini API key (always non-empty).
+    Obtain it via get_env(), which validates once per process.
     """
 
-    def __init__(self) -> None:
-        api_key: Optional[str] = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            _log.error("Required env var GOOGLE_API_KEY is not set.")
-            sys.exit("ERROR: Missing GOOGLE_API_KEY. Set it in your environment or .env file.")
-        self.google_api_key: str = api_key
-        _log.info("GOOGLE_API_KEY detected and loaded.")
+    google_api_key: str
+
+
+@functools.lru_cache(maxsize=1)
+def get_env() -> EnvConfig:
+    """
+    Return the process-wide EnvConfig, reading the environment on first call.
+
+    - Exits the process if GOOGLE_API_KEY is missing.
+    - Call after load_dotenv(); the result is cached for the process lifetime.
+    """
+    api_key: Optional[str] = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        _log.error("Required env var GOOGLE_API_KEY is not set.")
+        sys.exit("ERROR: Missing GOOGLE_API_KEY. Set it in your environment or .env file.")
+    _log.info("GOOGLE_API_KEY detected and loaded.")
+    return EnvConfig(google_api_key=api_key)
@@ -1,21 +1,118 @@
 # app/boot/load_settings.py
 
 import os
+import copy
 import yaml
 import argparse
 import logging
-from typing import Dict, Any, Optional, TypedDict
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, TypedDict
+
+import orjson
+
+try:  # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
 
 _log = logging.getLogger(__name__)
 
+# Process-wide parse cache: abs path -> (st_mtime_ns, st_size, st_ino, parsed)
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_LOCK = threading.Lock()
+_YAML_CACHE_MAX = 16
+
+# On-disk sidecar so fresh processes can skip YAML parsing entirely.
+# JSON (not pickle): loading it can only ever yield maps, lists and scalars.
+_SIDECAR_SUFFIX = ".cache.json"
+
+
+def _read_sidecar(path: str, stamp: Tuple[int, int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached settings next to `path` if they were built from the same file stat.
+    """
+    try:
+        with open(path + _SIDECAR_SUFFIX, "rb") as fh:
+            payload = orjson.loads(fh.read())
+        cached_stamp, parsed = payload["stamp"], payload["config"]
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        _log.debug("Ignoring unreadable settings sidecar: %s", exc)
+        return None
+    if tuple(cached_stamp) != stamp or not isinstance(parsed, dict):
+        return None
+    return parsed
+
+
+def _write_sidecar(path: str, stamp: Tuple[int, int, int], parsed: Dict[str, Any]) -> None:
+    """
+    Atomically write the settings sidecar (best-effort; read-only trees are fine).
+    Skipped when the settings do not survive a JSON round-trip unchanged (e.g. YAML dates).
+    """
+    directory = os.path.dirname(path)
+    try:
+        blob = orjson.dumps({"stamp": list(stamp), "config": parsed})
+        if orjson.loads(blob)["config"] != parsed:
+            _log.debug("Settings are not JSON-exact; skipping sidecar.")
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(blob)
+            os.replace(tmp_path, path + _SIDECAR_SUFFIX)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as exc:
+        _log.debug("Could not write settings sidecar: %s", exc)
+
+
+def _read_yaml_cached(path: str) -> Dict[str, Any]:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    The entry is invalidated when (mtime_ns, size, inode) differs from the
+    stat taken at parse time. Bounded LRU of _YAML_CACHE_MAX paths, backed
+    by a JSON sidecar (<path>.cache.json) shared across processes.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    with _YAML_CACHE_LOCK:
+        hit = _YAML_CACHE.get(key)
+        if hit is not None and hit[:3] == stamp:
+            _YAML_CACHE.move_to_end(key)
+            _log.debug("Settings cache hit for %s", key)
+            return hit[3]
+
+    parsed = _read_sidecar(key, stamp)
+    if parsed is None:
+        with open(key, "r", encoding="utf-8") as fh:
+            parsed = yaml.load(fh, Loader=_YamlLoader) or {}
+        _write_sidecar(key, stamp, parsed)
+    else:
+        _log.debug("Settings sidecar hit for %s", key)
+
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[key] = (*stamp, parsed)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+    return parsed
+
 
 class AppConfigLoader:
     """
     Singleton-style settings loader.
 
-    - Loads the base YAML from settings/agent-settings.yaml
-    - Exposes a copy via get_config()
-    - Applies CLI arg overrides via merge_with_args()
+    - Loads the base YAML from settings/agent-settings.yaml (parse-cached)
+    - Exposes a deep copy via get_config(), or the shared dict via get_config_readonly()
+    - Applies CLI arg overrides via merge_with_args() (published as the effective config)
     """
     _instance = None
     _config: Optional[Dict[str, Any]] = None
@@ -43,9 +140,8 @@ class AppConfigLoader:
         settings_path = os.path.join(project_root, "settings", "agent-settings.yaml")
 
         try:
-            with open(settings_path, "r", encoding="utf-8") as fh:
-                self._config = yaml.safe_load(fh) or {}
-                _log.info("Settings loaded from %s", settings_path)
+            self._config = _read_yaml_cached(settings_path)
+            _log.info("Settings loaded from %s", settings_path)
         except FileNotFoundError:
             _log.warning("Settings file not found at %s. Using empty defaults.", settings_path)
             self._config = {}
@@ -53,23 +149,33 @@ class AppConfigLoader:
             _log.error("Failed to load settings: %s", exc, exc_info=True)
             self._config = {}
 
-
     # ──────────────────────────────────────────────────────────────────────────
     # Public API
     # ──────────────────────────────────────────────────────────────────────────
     def get_config(self) -> Dict[str, Any]:
         """
-        Return a shallow copy of the loaded settings.
+        Return a deep copy of the loaded settings (safe to mutate).
         """
         _log.debug("Providing a copy of the loaded settings.")
-        return dict(self._config or {})
+        return copy.deepcopy(self._config or {})
+
+    def get_config_readonly(self) -> Dict[str, Any]:
+        """
+        Return the shared settings dict without copying.
+        Callers must not mutate it; use get_config() when changes are needed.
+        """
+        return self._config or {}
 
     def merge_with_args(self, args: argparse.Namespace) -> Dict[str, Any]:
         """
         Merge CLI flags into the loaded configuration.
         CLI always takes precedence over YAML.
 
-        Returns a new merged dict (does not mutate the internal cache).
+        The merged dict becomes the loader's effective config, so later
+        get_config()/get_config_readonly() calls (LLM and BigQuery bootstrap)
+        see the overrides. The parsed-YAML cache itself is never mutated.
+
+        Returns a copy of the merged dict (safe to mutate).
         """
         _log.info("Merging CLI arguments into settings.")
         cfg = self.get_config()
@@ -92,5 +198,6 @@ class AppConfigLoader:
         if getattr(args, "verbose", False) or getattr(args, "debug", False):
             log_cfg["level"] = "DEBUG"
 
+        self._config = cfg
         _log.info("Settings merge complete.")
-        return cfg
+        return copy.deepcopy(cfg)
@@ -1,16 +1,19 @@
 # app/cli.py
 
 import sys
+import asyncio
 import logging
 import argparse
 from typing import List, Dict, Any, Optional
-import io 
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
-from app.backends.bq_runner import BigQueryRunner
 from app.boot.load_settings import AppConfigLoader
-from app.orchestration.run_once import run_chat_once
+
+# Heavy backends (pandas, google-cloud-bigquery, langchain/langgraph) are
+# imported inside the command handlers so `--help` and `check-bq` only pay
+# for what they use.
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -109,6 +112,8 @@ def cmd_check_bq(app_cfg: Dict[str, Any], tables_csv: Optional[str]) -> int:
     Returns:
         0 on success, 1 on failure.
     """
+    from app.backends.bq_runner import BigQueryRunner
+
     bq_cfg = app_cfg.get("bigquery", {})
     try:
         runner = BigQueryRunner(
@@ -152,6 +157,82 @@ def cmd_check_bq(app_cfg: Dict[str, Any], tables_csv: Optional[str]) -> int:
     return 0
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Chat utilities
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _prewarm_graph(agent_cfg: Dict[str, Any]) -> "Future[Any]":
+    """
+    Import the orchestration stack and compile the graph in a background thread,
+    so both overlap with the welcome banner and the user typing.
+    """
+    def _build() -> Any:
+        # The heavy imports (langchain, langgraph, pandas, BigQuery) happen here, off the main thread
+        from app.orchestration.run_once import get_graph_for
+
+        return get_graph_for(agent_cfg)
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graph-warmup")
+    try:
+        return pool.submit(_build)
+    finally:
+        pool.shutdown(wait=False)
+
+
+async def _chat_turn(
+    question: str,
+    agent_cfg: Dict[str, Any],
+    warmup: Optional["Future[Any]"],
+) -> Any:
+    """
+    One chat turn on the event loop (waits for the background graph build first, if given).
+    """
+    from app.orchestration.run_once import run_chat_once_async
+
+    if warmup is not None:
+        await asyncio.wrap_future(warmup)
+    # Intermediate steps are logged at DEBUG (see --debug)
+    return await run_chat_once_async(question=question, agent_config=agent_cfg)
+
+
+def _chat_loop(agent_cfg: Dict[str, Any]) -> None:
+    """
+    Interactive prompt loop; each turn runs the graph asynchronously.
+
+    The prompt itself stays synchronous: the Runner's SIGINT handling is only
+    active inside runner.run(), so Ctrl-C at input() exits cleanly as before.
+    """
+    warmup: Optional["Future[Any]"] = _prewarm_graph(agent_cfg)
+    _print_welcome()
+    with asyncio.Runner() as runner:
+        while True:
+            try:
+                _print_prompt_header()
+                user_text = input(" - ").strip()
+                _print_footer()
+            except (EOFError, KeyboardInterrupt):
+                print()
+                break
+
+            if user_text.lower() in {":quit", "exit", "quit"}:
+                break
+
+            try:
+                # First turn also waits for the background graph build
+                pending, warmup = warmup, None
+                reply = runner.run(_chat_turn(user_text, agent_cfg, pending))
+
+                _print_answer_header()
+                print(reply if isinstance(reply, str) else f"{reply}")
+                _print_footer()
+            except Exception as exc:
+                logging.error("Chat execution error: %s", exc, exc_info=True)
+                print(_box("Something went wrong"))
+                print(f"Reason: {exc}")
+                _print_footer()
+                continue
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # CLI
 # ──────────────────────────────────────────────────────────────────────────────
@@ -193,6 +274,13 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
+    # Load .env (best-effort) before anything can snapshot the environment
+    dotenv_error: Optional[Exception] = None
+    try:
+        load_dotenv()
+    except Exception as exc:
+        dotenv_error = exc
+
     # Merge config
     settings_loader = AppConfigLoader()
     cfg = settings_loader.merge_with_args(args)
@@ -200,54 +288,16 @@ def main() -> None:
     # Logging
     setup_logging(cfg, verbose=args.verbose, debug=args.debug)
 
-    # Load .env (best-effort)
-    try:
-        load_dotenv()
+    if dotenv_error is None:
         logging.info("Environment variables loaded from .env")
-    except Exception as exc:
-        logging.warning("Unable to load .env: %s", exc)
+    else:
+        logging.warning("Unable to load .env: %s", dotenv_error)
 
     if args.command == "check-bq":
         sys.exit(cmd_check_bq(cfg, args.tables))
 
     if args.command == "chat":
-        agent_cfg = cfg.get("agent", {})
-        _print_welcome()
-        while True:
-            try:
-                _print_prompt_header()
-                user_text = input(" - ").strip()
-                _print_footer()
-            except (EOFError, KeyboardInterrupt):
-                print()
-                break
-
-            if user_text.lower() in {":quit", "exit", "quit"}:
-                break
-
-            try:
-                # Capture any intermediate prints from the orchestration layer
-                _captured = io.StringIO()
-                _old_stdout = sys.stdout
-                try:
-                    sys.stdout = _captured
-                    reply = run_chat_once(
-                        question=user_text,
-                        agent_config=agent_cfg,
-                    )
-                finally:
-                    sys.stdout = _old_stdout  # restore stdout
-
-                _print_answer_header()
-                print(reply if isinstance(reply, str) else f"{reply}")
-                _print_footer()
-            except Exception as exc:
-                logging.error("Chat execution error: %s", exc, exc_info=True)
-                print(_box("Something went wrong"))
-                print(f"Reason: {exc}")
-                _print_footer()
-                continue
-
+        _chat_loop(cfg.get("agent", {}))
         return
 
     parser.print_help()
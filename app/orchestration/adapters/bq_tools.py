@@ -1,39 +1,206 @@
 # app/orchestration/adapters/bq_tools.py
 
+import asyncio
 import json
+import hashlib
 import logging
+import functools
 import re
-from typing import Optional
-
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
 from google.cloud import bigquery
 from google.api_core.exceptions import GoogleAPICallError, BadRequest
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
+
+try:  # AST-based SQL checks; the regex path below is the fallback
+    import sqlglot
+    from sqlglot import exp
+except ImportError:
+    sqlglot = None
 
 from app.boot.load_settings import AppConfigLoader
 from app.backends.bq_runner import BigQueryRunner
 
 _log = logging.getLogger(__name__)
 
-# Shared runner singleton
-_RUNNER: Optional[BigQueryRunner] = None
-
 # Safety caps
 SCAN_CAP_BYTES = 1024 * 1024 * 1024  
 ROW_LIMIT_CAP = 1000
 
+# SQL safety patterns (case-insensitive, matched against the raw SQL text)
+_SELECT_PREFIX_RE = re.compile(r"\s*select\b", re.IGNORECASE)
+_SELECT_STAR_RE = re.compile(r"\bselect\s+\*\s+from", re.IGNORECASE)
+_LIMIT_RE = re.compile(r"\blimit\s+(\d+)", re.IGNORECASE)
+_MULTI_STATEMENT_RE = re.compile(r";\s*\S")
+
+# Session cache of rendered results: digest(sql, top_n_rows) -> text table
+_RESULT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE_MAX = 32
+
+# Serializes first-time runner construction (tool calls may arrive concurrently)
+_RUNNER_LOCK = threading.Lock()
+
+
+def _check_sql_regex(sql: str) -> Optional[str]:
+    """Textual safety checks; returns an error message or None."""
+    if _MULTI_STATEMENT_RE.search(sql):
+        _log.warning("Rejected multi-statement SQL.")
+        return "ERROR: Only a single SELECT statement is allowed."
+
+    if _SELECT_STAR_RE.search(sql):
+        _log.warning("Rejected SELECT * usage.")
+        return "ERROR: Avoid `SELECT *`. Specify the required columns explicitly."
+
+    limit_match = _LIMIT_RE.search(sql)
+    if not limit_match:
+        _log.warning("Missing LIMIT clause.")
+        return "ERROR: Query must include a numeric LIMIT clause."
+
+    limit_value = int(limit_match.group(1))
+    if limit_value > ROW_LIMIT_CAP:
+        _log.warning("Limit exceeds allowed cap: %s", limit_value)
+        return f"ERROR: LIMIT {limit_value} exceeds the maximum allowed {ROW_LIMIT_CAP}."
+    return None
+
+
+def _check_sql_ast(sql: str) -> Optional[str]:
+    """
+    Safety checks on the parsed BigQuery AST; returns an error message or None.
+    Raises sqlglot errors for unparseable SQL (callers fall back to regex checks).
+    """
+    # parse_one would keep only the first statement; scripts must be rejected whole
+    statements = [stmt for stmt in sqlglot.parse(sql, dialect="bigquery") if stmt is not None]
+    if len(statements) != 1:
+        _log.warning("Rejected multi-statement SQL.")
+        return "ERROR: Only a single SELECT statement is allowed."
+
+    ast = statements[0]
+    if not isinstance(ast, exp.Query):
+        _log.warning("Rejected non-SELECT query.")
+        return "ERROR: Only read-only SELECT statements are allowed."
+
+    # Wildcard projections anywhere, including subqueries and `t.*`
+    for select in ast.find_all(exp.Select):
+        if any(proj.is_star for proj in select.expressions):
+            _log.warning("Rejected SELECT * usage.")
+            return "ERROR: Avoid `SELECT *`. Specify the required columns explicitly."
+
+    # The outermost LIMIT bounds the rows returned
+    limit = ast.args.get("limit")
+    limit_expr = limit.expression if limit is not None else None
+    if not (isinstance(limit_expr, exp.Literal) and limit_expr.is_int):
+        _log.warning("Missing LIMIT clause.")
+        return "ERROR: Query must include a numeric LIMIT clause."
+
+    limit_value = int(limit_expr.this)
+    if limit_value > ROW_LIMIT_CAP:
+        _log.warning("Limit exceeds allowed cap: %s", limit_value)
+        return f"ERROR: LIMIT {limit_value} exceeds the maximum allowed {ROW_LIMIT_CAP}."
+    return None
+
+
+def _check_sql(sql: str) -> Optional[str]:
+    """
+    Enforce the read-only / no wildcard / bounded LIMIT rules.
+    Uses sqlglot when installed, falling back to regexes on ImportError or parse errors.
+    """
+    if not _SELECT_PREFIX_RE.match(sql):
+        _log.warning("Rejected non-SELECT query.")
+        return "ERROR: Only read-only SELECT statements are allowed."
+
+    if sqlglot is not None:
+        try:
+            return _check_sql_ast(sql)
+        except sqlglot.errors.SqlglotError as exc:
+            _log.debug("sqlglot could not parse query (%s); using regex checks.", exc)
+    return _check_sql_regex(sql)
+
+
+def _trim_text(value: Any) -> str:
+    return str(value)[:40]
+
+
+def _preview_formatters(frame: pd.DataFrame) -> Dict[str, Callable[[Any], str]]:
+    """
+    Per-column display formatters for DataFrame.to_string:
+    thousands separators for ints, 2 decimals for floats, text trimmed to 40 chars.
+    """
+    formatters: Dict[str, Callable[[Any], str]] = {}
+    for col, dtype in frame.dtypes.items():
+        if is_bool_dtype(dtype):
+            continue
+        if is_integer_dtype(dtype):
+            formatters[col] = "{:,}".format
+        elif is_float_dtype(dtype):
+            formatters[col] = "{:,.2f}".format
+        elif is_object_dtype(dtype) or is_string_dtype(dtype):
+            formatters[col] = _trim_text
+    return formatters
+
+
+def _result_cache_enabled() -> bool:
+    """agent.cache_sql_results from settings (default: enabled)."""
+    agent_cfg = AppConfigLoader().get_config_readonly().get("agent", {})
+    return bool(agent_cfg.get("cache_sql_results", True))
+
+
+def _dry_run_enabled() -> bool:
+    """bigquery.dry_run_preflight from settings (default: disabled; debugging aid)."""
+    bq_cfg = AppConfigLoader().get_config_readonly().get("bigquery", {})
+    return bool(bq_cfg.get("dry_run_preflight", False))
+
+
+def _is_scan_cap_error(exc: Exception) -> bool:
+    """True if BigQuery rejected the job for exceeding maximum_bytes_billed."""
+    errors = getattr(exc, "errors", None) or []
+    return any(err.get("reason") == "bytesBilledLimitExceeded" for err in errors if isinstance(err, dict))
+
+
+def _result_cache_key(sql: str, top_n_rows: Optional[int]) -> str:
+    payload = f"{top_n_rows}\x00{sql.strip()}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _result_cache_get(key: str) -> Optional[str]:
+    with _RESULT_CACHE_LOCK:
+        hit = _RESULT_CACHE.get(key)
+        if hit is not None:
+            _RESULT_CACHE.move_to_end(key)
+        return hit
+
+
+def _result_cache_put(key: str, rendered: str) -> None:
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = rendered
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+
 
 def _get_runner() -> BigQueryRunner:
     """
     Return a shared BigQueryRunner instance.
-    Pulls project/dataset from settings; initializes once.
+    Pulls project/dataset from settings; initializes once, even under concurrent tool calls.
     """
-    global _RUNNER
-    if _RUNNER is not None:
-        _log.info("Reusing BigQuery runner singleton.")
-        return _RUNNER
+    with _RUNNER_LOCK:
+        return _build_runner()
 
+
+@functools.lru_cache(maxsize=1)
+def _build_runner() -> BigQueryRunner:
     _log.info("Creating BigQuery runner singleton.")
-    cfg = AppConfigLoader().get_config()
+    cfg = AppConfigLoader().get_config_readonly()
     bq_cfg = cfg.get("bigquery", {})
 
     project_id = bq_cfg.get("project_id")
@@ -43,13 +210,12 @@ def _get_runner() -> BigQueryRunner:
         _log.error("BigQuery configuration missing project_id or dataset_id.")
         raise ValueError("BigQuery dataset_id and project_id must be provided in settings or CLI.")
 
-    _RUNNER = BigQueryRunner(project_id=project_id, dataset_id=dataset_id)
+    runner = BigQueryRunner(project_id=project_id, dataset_id=dataset_id)
     _log.info("BigQuery runner ready.")
-    return _RUNNER
+    return runner
 
 
-@tool
-def run_sql_bq_tool(*, sql: str, top_n_rows: Optional[int] = 50) -> str:
+def _run_sql_bq(*, sql: str, top_n_rows: Optional[int] = 50) -> str:
     """
     Execute a BigQuery Standard SQL statement and return a text table of results.
 
@@ -57,99 +223,121 @@ def run_sql_bq_tool(*, sql: str, top_n_rows: Optional[int] = 50) -> str:
       - Read-only: must start with SELECT
       - No SELECT * (explicit columns required)
       - Must include a numeric LIMIT <= ROW_LIMIT_CAP
-      - Dry-run first; refuse if bytes scanned would exceed SCAN_CAP_BYTES
+      - Refused by BigQuery if bytes billed would exceed SCAN_CAP_BYTES
     """
     _log.info("Received SQL for execution.")
 
     # --- Safety checks ---
-    q = sql.lstrip().lower()
-    if not q.startswith("select"):
-        _log.warning("Rejected non-SELECT query.")
-        return "ERROR: Only read-only SELECT statements are allowed."
-
-    if re.search(r"select\s+\*\s+from", q):
-        _log.warning("Rejected SELECT * usage.")
-        return "ERROR: Avoid `SELECT *`. Specify the required columns explicitly."
-
-    limit_match = re.search(r"limit\s+(\d+)", q)
-    if limit_match:
-        limit_value = int(limit_match.group(1))
-        if limit_value > ROW_LIMIT_CAP:
-            _log.warning("Limit exceeds allowed cap: %s", limit_value)
-            return f"ERROR: LIMIT {limit_value} exceeds the maximum allowed {ROW_LIMIT_CAP}."
-    else:
-        _log.warning("Missing LIMIT clause.")
-        return "ERROR: Query must include a numeric LIMIT clause."
+    violation = _check_sql(sql)
+    if violation is not None:
+        return violation
+
+    # --- Session result cache ---
+    cache_key: Optional[str] = None
+    if _result_cache_enabled():
+        cache_key = _result_cache_key(sql, top_n_rows)
+        cached = _result_cache_get(cache_key)
+        if cached is not None:
+            _log.info("Returning cached result for repeated query.")
+            return cached
 
     try:
         runner = _get_runner()
 
-        # --- Dry run ---
-        try:
-            _log.info("Performing dry run...")
-            dry_cfg = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
-            dry_job = runner.client.query(sql, job_config=dry_cfg)
-
-            if dry_job.total_bytes_processed > SCAN_CAP_BYTES:
-                _log.warning(
-                    "Dry run indicates excessive scan: %s bytes > %s cap",
-                    dry_job.total_bytes_processed,
-                    SCAN_CAP_BYTES,
-                )
-                return (
-                    "ERROR: Query would scan "
-                    f"{dry_job.total_bytes_processed} bytes, exceeding the cap of {SCAN_CAP_BYTES}."
-                )
-            _log.info("Dry run OK.")
-        except (GoogleAPICallError, BadRequest) as exc: 
-            _log.error("Dry run failed: %s", exc)
-            return f"Dry run failed: {exc}"
+        # --- Optional dry run (the byte cap below is enforced server-side anyway) ---
+        if _dry_run_enabled():
+            try:
+                _log.info("Performing dry run...")
+                dry_cfg = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+                dry_job = runner.client.query(sql, job_config=dry_cfg)
+
+                if dry_job.total_bytes_processed > SCAN_CAP_BYTES:
+                    _log.warning(
+                        "Dry run indicates excessive scan: %s bytes > %s cap",
+                        dry_job.total_bytes_processed,
+                        SCAN_CAP_BYTES,
+                    )
+                    return (
+                        "ERROR: Query would scan "
+                        f"{dry_job.total_bytes_processed} bytes, exceeding the cap of {SCAN_CAP_BYTES}."
+                    )
+                _log.info("Dry run OK.")
+            except (GoogleAPICallError, BadRequest) as exc:
+                _log.error("Dry run failed: %s", exc)
+                return f"Dry run failed: {exc}"
 
         # --- Actual execution ---
         _log.info("Executing query against BigQuery.")
-        run_cfg = bigquery.QueryJobConfig(dry_run=False, use_query_cache=True)
-        df = runner.execute_query(sql, job_config=run_cfg)
+        run_cfg = bigquery.QueryJobConfig(
+            dry_run=False,
+            use_query_cache=True,
+            maximum_bytes_billed=SCAN_CAP_BYTES,
+        )
+        try:
+            df = runner.execute_query(sql, job_config=run_cfg)
+        except GoogleAPICallError as exc:
+            if not _is_scan_cap_error(exc):
+                raise
+            _log.warning("Query rejected by BigQuery: bytes billed would exceed %s cap.", SCAN_CAP_BYTES)
+            return f"ERROR: Query would scan more than the cap of {SCAN_CAP_BYTES} bytes."
         _log.info("Execution complete.")
 
         # ── Pretty print: thousands separators, 2 decimals for floats, trim long text ──
         preview = df if top_n_rows is None else df.head(top_n_rows)
 
-        def _format_frame(frame):
-            fmt_frame = frame.copy()
+        rendered = preview.to_string(index=False, formatters=_preview_formatters(preview))
+        if cache_key is not None:
+            _result_cache_put(cache_key, rendered)
+        return rendered
 
-            # Trim long text columns to 40 chars
-            for col in fmt_frame.select_dtypes(include=["object"]).columns:
-                fmt_frame[col] = fmt_frame[col].astype(str).str.slice(0, 40)
+    except Exception as exc:
+        _log.error("Query execution failed: %s", exc)
+        return f"ERROR: {exc}"
 
-            # Format integers with thousands separators
-            for col in fmt_frame.select_dtypes(include=["int", "int64", "Int64"]).columns:
-                fmt_frame[col] = fmt_frame[col].map(lambda x: f"{x:,}")
 
-            # Format floats with thousands separators and 2 decimals
-            for col in fmt_frame.select_dtypes(include=["float", "float64"]).columns:
-                fmt_frame[col] = fmt_frame[col].map(lambda x: f"{x:,.2f}")
+async def _arun_sql_bq(*, sql: str, top_n_rows: Optional[int] = 50) -> str:
+    """Async entry point: runs the blocking BigQuery round-trip in a worker thread."""
+    return await asyncio.to_thread(_run_sql_bq, sql=sql, top_n_rows=top_n_rows)
 
-            return fmt_frame
 
-        pretty = _format_frame(preview)
-        return pretty.to_string(index=False)
+# Sync body for graph.stream/invoke; coroutine for astream, where ToolNode
+# gathers the independent tool calls of one LLM turn concurrently
+run_sql_bq_tool = StructuredTool.from_function(
+    func=_run_sql_bq,
+    coroutine=_arun_sql_bq,
+    name="run_sql_bq_tool",
+)
 
-    except Exception as exc:
-        _log.error("Query execution failed: %s", exc)
-        return f"ERROR: {exc}"
 
+@functools.lru_cache(maxsize=64)
+def _schema_json(table_name: str) -> str:
+    """
+    Serialized schema for a table; cached so repeat inspections skip json.dumps.
+    """
+    return json.dumps(_get_runner().get_table_schema(table_name))
 
-@tool
-def inspect_bq_schema_tool(*, table_name: str) -> str:
+
+def _inspect_bq_schema(*, table_name: str) -> str:
     """
     Return the JSON schema for a table (e.g., 'orders', 'users') in the configured dataset.
     """
     _log.info("Describing schema for table: %s", table_name)
     try:
-        runner = _get_runner()
-        schema = runner.get_table_schema(table_name)
+        schema_json = _schema_json(table_name)
         _log.info("Schema retrieval successful.")
-        return json.dumps(schema)
+        return schema_json
     except Exception as exc:
         _log.error("Failed to retrieve schema: %s", exc)
         return f"ERROR: {exc}"
+
+
+async def _ainspect_bq_schema(*, table_name: str) -> str:
+    """Async entry point: runs the blocking schema lookup in a worker thread."""
+    return await asyncio.to_thread(_inspect_bq_schema, table_name=table_name)
+
+
+inspect_bq_schema_tool = StructuredTool.from_function(
+    func=_inspect_bq_schema,
+    coroutine=_ainspect_bq_schema,
+    name="inspect_bq_schema_tool",
+)
@@ -1,13 +1,16 @@
 # app/orchestration/build_flow.py
 
 import logging
+from typing import Union
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import ToolNode, tools_condition as _tools_condition_base
 
 from app.orchestration.session_state import AgentState
 from app.orchestration.stages.analyst import AnalyzeNode
+from app.orchestration.stages.stage_base import AsyncBaseNode, BaseNode
 from app.orchestration.adapters.bq_tools import (
     run_sql_bq_tool,
     inspect_bq_schema_tool,
@@ -16,53 +19,49 @@ from app.orchestration.adapters.bq_tools import (
 _log = logging.getLogger(__name__)
 
 
-def build_graph() -> StateGraph:
+def _as_node(stage: Union[BaseNode, AsyncBaseNode], name: str) -> RunnableLambda:
+    """Wrap a stage with both a sync body (stream/invoke) and an async body (astream/ainvoke)."""
+    if isinstance(stage, AsyncBaseNode):
+        return RunnableLambda(stage.call_sync, afunc=stage.__call__, name=name)
+    return RunnableLambda(stage, afunc=stage.acall, name=name)
+
+
+def build_graph(with_checkpointer: bool = False) -> StateGraph:
     """
     Assemble and compile the orchestration graph.
 
+    Args:
+        with_checkpointer: Attach an in-memory MemorySaver so state persists
+            across turns on the same thread_id. Off by default: every
+            superstep then skips serializing the full message history.
     """
     _log.info("Composing orchestration graph ...")
 
     g = StateGraph(AgentState)
 
-    # Main reasoning stage
-    g.add_node("analyst", AnalyzeNode())
+    # Main reasoning stage (sync for stream/invoke, async for astream/ainvoke)
+    g.add_node("analyst", _as_node(AnalyzeNode(), "analyst"))
 
-    # Tool hub
+    # Tool hub (under astream, multiple tool calls in one step run concurrently)
     toolset = [run_sql_bq_tool, inspect_bq_schema_tool]
     g.add_node("workbench", ToolNode(tools=toolset))
 
-    # No-op finalize node
-    def _finalize(state: AgentState) -> AgentState:
-        return state
-
-    g.add_node("finalize", _finalize)
-
-    
-    def _route_label(state: AgentState) -> str:
-        outcome = _tools_condition_base(state)
-        return "tools" if outcome == "tools" else "finish"
-
-    # Conditional routing
+    # Conditional routing on the prebuilt's native labels ("tools" / "__end__")
     g.add_conditional_edges(
         "analyst",
-        _route_label,
-        {"tools": "workbench", "finish": "finalize"},
+        _tools_condition_base,
+        {"tools": "workbench", "__end__": "__end__"},
     )
 
     # Tools feed back into analyst
     g.add_edge("workbench", "analyst")
 
-    # Finalize then end
-    g.add_edge("finalize", "__end__")
-
     # Entry point
     g.set_entry_point("analyst")
 
-    # Compile with in-memory checkpoints
-    memory = MemorySaver()
+    # Compile (optionally with in-memory checkpoints)
+    memory = MemorySaver() if with_checkpointer else None
     graph = g.compile(checkpointer=memory)
 
-
     _log.info("Orchestration compiled successfully.")
     return graph
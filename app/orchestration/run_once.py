@@ -1,7 +1,8 @@
 # app/orchestration/run_once.py
 
 import logging
-from typing import Optional, Dict, Any
+import functools
+from typing import Optional, Dict, Any, List
 
 from langchain_core.messages import HumanMessage
 from langgraph.errors import GraphRecursionError
@@ -11,15 +12,6 @@ from app.orchestration.session_state import AgentState
 
 _log = logging.getLogger(__name__)
 
-# Module-level singleton for the compiled graph
-_GRAPH_SINGLETON: Optional[Any] = None
-
-
-def _fmt_step(content: str) -> str:
-    """Lightweight step divider for streamed graph messages."""
-    bar = "─" * 72
-    return f"\n{bar}\n{content}\n{bar}\n"
-
 
 def _fmt_msg_preview(msg: Any) -> str:
     """
@@ -38,15 +30,65 @@ def _fmt_msg_preview(msg: Any) -> str:
     return f"{role_tag}\n{text}"
 
 
-def get_graph() -> Any:
+@functools.lru_cache(maxsize=2)
+def _graph_for_mode(with_checkpointer: bool, /) -> Any:
+    """Build and cache one compiled graph per checkpointer mode (positional key only)."""
+    _log.info("Constructing orchestration graph (singleton).")
+    return build_graph(with_checkpointer=with_checkpointer)
+
+
+def get_graph(with_checkpointer: bool = False) -> Any:
+    """
+    Retrieve or build the state graph (one singleton per checkpointer mode).
+    Defaults match build_graph: no checkpointer.
+    """
+    return _graph_for_mode(bool(with_checkpointer))
+
+
+def get_graph_for(agent_config: Dict[str, Any]) -> Any:
     """
-    Retrieve or build the state graph (singleton).
+    Graph matching agent.session_memory (keep conversation state across turns; default on).
     """
-    global _GRAPH_SINGLETON
-    if _GRAPH_SINGLETON is None:
-        _log.info("Constructing orchestration graph (singleton).")
-        _GRAPH_SINGLETON = build_graph()
-    return _GRAPH_SINGLETON
+    return _graph_for_mode(bool(agent_config.get("session_memory", True)))
+
+
+def _initial_state(question: str) -> AgentState:
+    """Seed state for a single turn."""
+    return AgentState(messages=[HumanMessage(content=question)], question=question)
+
+
+def _run_config(agent_config: Dict[str, Any]) -> Dict[str, Any]:
+    """LangGraph run config (thread id + recursion limit derived from max_iterations)."""
+    max_iterations = agent_config.get("max_iterations", 5)
+    return {
+        "configurable": {
+            "thread_id": "opsfleet-session",
+        },
+        "recursion_limit": 2 * max_iterations + 1,
+    }
+
+
+def _collect_step(ev: Dict[str, Any], trace: List[str]) -> None:
+    """Append a preview of the latest message in a streamed event to the turn trace."""
+    try:
+        msgs = ev.get("messages") or []
+        if msgs:
+            trace.append(_fmt_msg_preview(msgs[-1]))
+    except Exception as exc:
+        _log.error("Stream rendering error: %s", exc, exc_info=True)
+
+
+def _flush_trace(trace: Optional[List[str]]) -> None:
+    """Emit the collected step previews as a single DEBUG record."""
+    if trace:
+        _log.debug("Graph steps (%d):\n%s", len(trace), "\n\n".join(trace))
+
+
+def _final_text(last_event: Optional[Dict[str, Any]]) -> str:
+    """Extract the final assistant message content from the last streamed event."""
+    if last_event and last_event.get("messages"):
+        return last_event["messages"][-1].content  # type: ignore[return-value]
+    return "No response was produced by the agent."
 
 
 def run_chat_once(question: str, agent_config: Dict[str, Any]) -> str:
@@ -61,48 +103,67 @@ def run_chat_once(question: str, agent_config: Dict[str, Any]) -> str:
         Final assistant message content, or an explanatory error string.
     """
     _log.info("Starting single-turn graph execution.")
-    graph = get_graph()
-
-    initial_state: AgentState = {
-        "messages": [HumanMessage(content=question)],
-        "question": question,
-    }
-
-    max_iterations = agent_config.get("max_iterations", 5)
-    recursion_limit = 2 * max_iterations + 1
+    graph = get_graph_for(agent_config)
 
     try:
         events = graph.stream(
-            initial_state,
-            config={
-                "configurable": {
-                    "thread_id": "opsfleet-session",
-                },
-                "recursion_limit": recursion_limit,
-            },
+            _initial_state(question),
+            config=_run_config(agent_config),
             stream_mode="values",
         )
 
         _log.info("Streaming events from orchestration graph.")
 
+        # Step previews are buffered and logged once per turn (DEBUG only)
+        trace: Optional[List[str]] = [] if _log.isEnabledFor(logging.DEBUG) else None
         last_event: Optional[Dict[str, Any]] = None
         for ev in events:
             last_event = ev
-            try:
-                msgs = ev.get("messages") or []
-                if msgs:
-                    preview = _fmt_msg_preview(msgs[-1])
-                    print(_fmt_step(preview))
-            except Exception as exc:
-                _log.error("Stream rendering error: %s", exc, exc_info=True)
-                continue
+            if trace is not None:
+                _collect_step(ev, trace)
+        _flush_trace(trace)
 
         _log.info("Graph execution completed; delivering final response.")
+        return _final_text(last_event)
+
+    except GraphRecursionError:
+        _log.warning("Recursion limit reached; halting execution.")
+        return "Stopped: maximum reasoning depth reached for this request."
+    except Exception as exc:
+        _log.error("Unhandled error during graph execution: %s", exc, exc_info=True)
+        return f"Error: {exc}"
+
+
+async def run_chat_once_async(question: str, agent_config: Dict[str, Any]) -> str:
+    """
+    Async variant of run_chat_once.
+
+    Streams with graph.astream so the analyst awaits the LLM via ainvoke and
+    the tool node runs multiple tool calls from one step concurrently.
+    """
+    _log.info("Starting single-turn graph execution (async).")
+    graph = get_graph_for(agent_config)
+
+    try:
+        events = graph.astream(
+            _initial_state(question),
+            config=_run_config(agent_config),
+            stream_mode="values",
+        )
+
+        _log.info("Streaming events from orchestration graph.")
 
-        if last_event and last_event.get("messages"):
-            return last_event["messages"][-1].content  # type: ignore[return-value]
+        # Step previews are buffered and logged once per turn (DEBUG only)
+        trace: Optional[List[str]] = [] if _log.isEnabledFor(logging.DEBUG) else None
+        last_event: Optional[Dict[str, Any]] = None
+        async for ev in events:
+            last_event = ev
+            if trace is not None:
+                _collect_step(ev, trace)
+        _flush_trace(trace)
 
-        return "No response was produced by the agent."
+        _log.info("Graph execution completed; delivering final response.")
+        return _final_text(last_event)
 
     except GraphRecursionError:
         _log.warning("Recursion limit reached; halting execution.")
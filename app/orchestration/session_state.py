@@ -1,14 +1,19 @@
 # app/orchestration/session_state.py
 
-from typing import TypedDict, Annotated, Optional, Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Annotated, Optional, Dict, Any, List
 from langgraph.graph.message import add_messages
 
 
-class AgentState(TypedDict, total=False):
+@dataclass(slots=True)
+class AgentState:
     """
     Conversation + runtime scratchpad for the orchestration graph.
 
-    Keys:
+    Nodes receive an AgentState instance and return a partial update dict
+    (e.g. {"messages": [...]}), which LangGraph merges via the reducers.
+
+    Fields:
         messages   : Rolling transcript carried by LangGraph (append-only).
         question   : The latest user question (string form for convenience).
         dataset_id : Active BigQuery dataset to target (e.g., 'project.dataset').
@@ -16,9 +21,9 @@ class AgentState(TypedDict, total=False):
         model_name : Identifier for the LLM chosen this run.
         summary    : Optional short-form result the agent may populate.
     """
-    messages: Annotated[List[Dict[str, Any]], add_messages]
-    question: str
-    dataset_id: str
-    project_id: Optional[str]
-    model_name: str
-    summary: Optional[str]
+    messages: Annotated[List[Dict[str, Any]], add_messages] = field(default_factory=list)
+    question: str = ""
+    dataset_id: str = ""
+    project_id: Optional[str] = None
+    model_name: str = ""
+    summary: Optional[str] = None
@@ -1,4 +1,4 @@
 from .analyst import AnalyzeNode
-from .stage_base import BaseNode
+from .stage_base import AsyncBaseNode, BaseNode
 
-__all__ = ["AnalyzeNode", "BaseNode"]
+__all__ = ["AnalyzeNode", "AsyncBaseNode", "BaseNode"]
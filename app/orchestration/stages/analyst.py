@@ -1,11 +1,18 @@
 # app/orchestration/stages/analyst.py
 
+import hashlib
+import json
 import logging
-from typing import Any
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from langchain_core.messages import SystemMessage
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
-from app.orchestration.stages.stage_base import BaseNode
+from app.boot.load_settings import AppConfigLoader
+from app.orchestration.stages.stage_base import AsyncBaseNode
 from app.orchestration.session_state import AgentState
 from app.orchestration.adapters.bq_tools import (
     run_sql_bq_tool,
@@ -14,40 +21,132 @@ from app.orchestration.adapters.bq_tools import (
 
 _log = logging.getLogger(__name__)
 
+# Tools exposed to the analyst LLM (stable, hashable source for bind_tools)
+_ANALYST_TOOLS = (run_sql_bq_tool, inspect_bq_schema_tool)
 
-class AnalyzeNode(BaseNode):
+# id(llm) -> (llm, llm bound to the analyst tools). Holding the llm keeps its id stable.
+_BOUND_LLMS: Dict[int, Tuple[Runnable, Runnable]] = {}
+_BOUND_LLMS_LOCK = threading.Lock()
+
+# Optional replay cache: digest(prompt + history) -> LLM reply (agent.cache_llm_responses)
+_RESPONSE_CACHE: "OrderedDict[str, BaseMessage]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_MAX = 256
+
+
+def _bind_analyst_tools(llm: Runnable) -> Runnable:
+    """
+    Bind the BigQuery tools to `llm`, reusing the bound runnable for the same llm
+    (tool schema generation is not repeated when nodes are rebuilt).
+    """
+    with _BOUND_LLMS_LOCK:
+        cached = _BOUND_LLMS.get(id(llm))
+        if cached is not None and cached[0] is llm:
+            return cached[1]
+        _log.info("Wiring tools into LLM for analyst stage.")
+        bound = llm.bind_tools(list(_ANALYST_TOOLS))
+        _BOUND_LLMS[id(llm)] = (llm, bound)
+        return bound
+
+
+@lru_cache(maxsize=4)
+def _system_message_for(prompt: str) -> SystemMessage:
+    """
+    One SystemMessage per distinct prompt text, shared by every AnalyzeNode
+    (pydantic validation runs once per process, not per node build).
+    Callers must treat the returned message as read-only.
+    """
+    return SystemMessage(content=prompt)
+
+
+def _response_cache_key(messages: Sequence[BaseMessage]) -> str:
+    # ids are assigned per run, so they are left out of the key
+    payload = json.dumps([m.model_dump(exclude={"id"}) for m in messages], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[BaseMessage]:
+    with _RESPONSE_CACHE_LOCK:
+        hit = _RESPONSE_CACHE.get(key)
+        if hit is None:
+            return None
+        _RESPONSE_CACHE.move_to_end(key)
+    # Fresh copy without an id so the graph appends it as a new message
+    return hit.model_copy(update={"id": None})
+
+
+def _response_cache_put(key: str, response: BaseMessage) -> None:
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = response
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
+class AnalyzeNode(AsyncBaseNode):
     """
     Reasoning stage that prepares the system prompt and binds BigQuery tools.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        _log.info("Wiring tools into LLM for analyst stage.")
-        self.llm_with_tools = self.llm.bind_tools(
-            [
-                run_sql_bq_tool,
-                inspect_bq_schema_tool,
-            ]
-        )
-
-    def __call__(self, state: AgentState) -> AgentState:
+        self.llm_with_tools = _bind_analyst_tools(self.llm)
+        # Bound methods cached for the per-turn hot path
+        self._invoke = self.llm_with_tools.invoke
+        self._ainvoke = self.llm_with_tools.ainvoke
+        # The system prompt is static; the message is built once per process
+        self._system_message = _system_message_for(self._load_prompt("analysis.md"))
+        _log.debug("System prompt loaded for analyst stage.")
+        # Off by default: a cache hit replays the earlier (possibly sampled) reply
+        agent_cfg = AppConfigLoader().get_config_readonly().get("agent", {})
+        self._cache_responses = bool(agent_cfg.get("cache_llm_responses", False))
+
+    def _messages_for(self, state: AgentState) -> List[BaseMessage]:
+        """
+        System message first, then the history.
+
+        The system prompt is the verbatim template (no per-turn substitutions), so
+        every call shares a byte-identical prefix that provider-side prompt caching
+        can reuse. Per-turn context must go after the history, never before it.
+        """
+        return [self._system_message, *state.messages]
+
+    def _cache_lookup(self, messages: Sequence[BaseMessage]) -> Tuple[Optional[str], Optional[BaseMessage]]:
+        """(cache key, cached reply); both None when response caching is disabled."""
+        if not self._cache_responses:
+            return None, None
+        cache_key = _response_cache_key(messages)
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            _log.info("Returning cached analyst response for identical input.")
+        return cache_key, cached
+
+    async def __call__(self, state: AgentState) -> Dict[str, Any]:
         """
         Invoke the LLM+tools on the current conversation state and return the new message.
+        Awaits ainvoke so the LLM round-trip does not block the event loop.
+        """
+        _log.debug("Analyst stage invoked with current state.")
+        messages = self._messages_for(state)
+        cache_key, cached = self._cache_lookup(messages)
+        if cached is not None:
+            return {"messages": [cached]}
+        # Errors propagate to run_chat_once*
+        response = await self._ainvoke(messages)
+        if cache_key is not None:
+            _response_cache_put(cache_key, response)
+        return {"messages": [response]}
+
+    def call_sync(self, state: AgentState) -> Dict[str, Any]:
+        """
+        Native sync path for graph.stream/invoke (no event loop needed).
         """
-        _log.info("Analyst stage invoked with current state.")
-        try:
-            messages = state.get("messages", [])
-            system_prompt = self._load_prompt("analysis.md")
-            _log.info("System prompt loaded for analyst stage.")
-
-            # Prepend the system message
-            enriched = [SystemMessage(content=system_prompt)] + list(messages)
-
-            _log.debug("Dispatching messages to LLM with tools.")
-            response = self.llm_with_tools.invoke(enriched)
-
-            _log.info("Analyst stage completed successfully.")
-            return {"messages": [response]}
-        except Exception as exc:
-            _log.error("Analyst stage error: %s", exc, exc_info=True)
-            raise
+        _log.debug("Analyst stage invoked with current state (sync).")
+        messages = self._messages_for(state)
+        cache_key, cached = self._cache_lookup(messages)
+        if cached is not None:
+            return {"messages": [cached]}
+        response = self._invoke(messages)
+        if cache_key is not None:
+            _response_cache_put(cache_key, response)
+        return {"messages": [response]}
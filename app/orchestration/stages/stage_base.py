@@ -1,64 +1,152 @@
 # app/orchestration/stages/stage_base.py
 
+import asyncio
 import logging
+import threading
+import importlib.resources as pkg_resources
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any, ClassVar, Dict, Optional
 
 from app.backends.model_gateway import get_llm
+from app.orchestration import instructions as _instr_pkg
 from app.orchestration.session_state import AgentState
 
 _log = logging.getLogger(__name__)
 
+# Packaged prompt templates and their on-disk fallback (resolved once at import)
+_INSTRUCTIONS_ROOT = pkg_resources.files(_instr_pkg)
+_FALLBACK_INSTRUCTIONS_DIR = Path(__file__).resolve().parents[1] / "instructions"
 
-class BaseNode(ABC):
+
+def _preload_prompts() -> Dict[str, str]:
+    """
+    Read every packaged .md template up front so the first stage call does no I/O.
+    Best-effort: anything missed here is loaded on demand by _get_prompt.
+    """
+    try:
+        return {
+            p.name: p.read_text(encoding="utf-8")
+            for p in _INSTRUCTIONS_ROOT.iterdir()
+            if p.name.endswith(".md")
+        }
+    except Exception as exc:
+        _log.warning("Prompt preload failed (%s); templates will load on demand.", exc)
+        return {}
+
+
+# template name -> text. Preloaded at import; on-demand loads are published
+# under _PROMPT_CACHE_LOCK so each template is read at most once per process.
+_PROMPT_CACHE: Dict[str, str] = _preload_prompts()
+_PROMPT_CACHE_LOCK = threading.Lock()
+
+
+def _get_prompt(template_name: str) -> str:
+    """
+    Return a cached prompt template, loading it on first use.
+    Call _PROMPT_CACHE.clear() to pick up edited templates during development.
+    """
+    text = _PROMPT_CACHE.get(template_name)
+    if text is not None:
+        return text
+    with _PROMPT_CACHE_LOCK:
+        text = _PROMPT_CACHE.get(template_name)
+        if text is None:
+            text = _read_prompt(template_name)
+            _PROMPT_CACHE[template_name] = text
+        return text
+
+
+def _read_prompt(template_name: str) -> str:
+    """
+    Load a prompt template by name from the packaged instructions folder,
+    with a filesystem fallback (uncached; use _get_prompt).
+    """
+    # Primary: the packaged instructions module
+    primary = _INSTRUCTIONS_ROOT.joinpath(template_name)
+    if primary.is_file():
+        _log.debug("Loading prompt template: %s", template_name)
+        return primary.read_text(encoding="utf-8")
+
+    # Fallback: the on-disk path relative to this file (FileNotFoundError propagates)
+    fallback = _FALLBACK_INSTRUCTIONS_DIR / template_name
+    _log.debug("Prompt not in package; trying fallback path: %s", fallback)
+    return fallback.read_text(encoding="utf-8")
+
+
+class _StageBase(ABC):
     """
-    Abstract base for orchestration stages.
+    Shared plumbing for sync and async stages.
 
-    - Grabs a shared LLM instance on init
-    - Provides a resilient prompt loader
+    - Grabs the process-wide LLM instance on init (one client for every stage)
+    - Provides a resilient, cached prompt loader
     """
 
+    _shared_llm: ClassVar[Optional[Any]] = None
+    _llm_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self) -> None:
-        _log.info("Stage bootstrap: acquiring shared LLM client.")
-        self.llm = get_llm()
+        # Double-checked so concurrent stage builds create exactly one client
+        if _StageBase._shared_llm is None:
+            with _StageBase._llm_lock:
+                if _StageBase._shared_llm is None:
+                    _log.info("Stage bootstrap: acquiring shared LLM client.")
+                    _StageBase._shared_llm = get_llm()
+        self.llm = _StageBase._shared_llm
 
     def _load_prompt(self, template_name: str) -> str:
         """
-        Load a prompt template by name from the packaged instructions folder,
-        with a filesystem fallback.
+        Return a prompt template by name from the process-wide cache.
+        Raises FileNotFoundError if the template does not exist.
+        """
+        return _get_prompt(template_name)
+
+
+class BaseNode(_StageBase):
+    """
+    Abstract base for sync orchestration stages.
+
+    - Concrete stages implement a sync __call__
+    - acall (used by graph.astream) runs it in a worker thread by default
+    """
+
+    @abstractmethod
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
+        """
+        Process the agent state and return a partial state update.
+        Concrete stages must implement this.
+        """
+        raise NotImplementedError("Stages must implement __call__")
+
+    async def acall(self, state: AgentState) -> Dict[str, Any]:
+        """
+        Async entry point used when the graph runs via astream/ainvoke.
+
+        Default: run the sync __call__ in a worker thread so the event loop
+        stays free. Stages with native async I/O should subclass AsyncBaseNode.
         """
-        import importlib.resources as pkg_resources
-
-        try:
-            # Primary: load from the packaged instructions module
-            from app.orchestration import instructions as _instr_pkg
-
-            _log.info("Loading prompt template: %s", template_name)
-            with pkg_resources.files(_instr_pkg).joinpath(template_name).open(
-                "r", encoding="utf-8"
-            ) as fh:
-                _log.info("Prompt template loaded: %s", template_name)
-                return fh.read()
-
-        except FileNotFoundError as exc:
-            _log.error("Prompt not found in package: %s", template_name)
-            raise exc
-
-        except Exception as exc:
-            # Fallback: compute the on-disk path relative to this file
-            _log.warning("Pkg resource load failed (%s); trying filesystem fallback.", exc)
-            fallback = Path(__file__).resolve().parents[1] / "instructions" / template_name
-            try:
-                _log.info("Fallback prompt path: %s", fallback)
-                return fallback.read_text(encoding="utf-8")
-            except Exception as fb_exc:
-                _log.error("Fallback prompt load failed: %s", fb_exc)
-                raise fb_exc
+        return await asyncio.to_thread(self, state)
+
+
+class AsyncBaseNode(_StageBase):
+    """
+    Abstract base for async-native orchestration stages.
+
+    - Concrete stages implement `async def __call__` (awaiting LLM/tool I/O)
+    - call_sync serves sync graph runs (stream/invoke); override it when the
+      stage has a native sync path, since the default spins up an event loop
+    """
 
     @abstractmethod
-    def __call__(self, state: AgentState) -> AgentState:
+    async def __call__(self, state: AgentState) -> Dict[str, Any]:
         """
-        Process the agent state and return an updated state.
+        Process the agent state and return a partial state update.
         Concrete stages must implement this.
         """
         raise NotImplementedError("Stages must implement __call__")
+
+    def call_sync(self, state: AgentState) -> Dict[str, Any]:
+        """
+        Sync shim for legacy callers; must not be used from a running event loop.
+        """
+        return asyncio.run(self(state))